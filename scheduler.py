@@ -1,10 +1,29 @@
 # src/scheduler.py
 from __future__ import annotations
+import sys
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Tuple
 
-
-@dataclass
+# Log event and reason names, interned once so every log call shares them
+EV_CREATE = sys.intern("create")
+EV_ENQUEUE = sys.intern("enqueue")
+EV_REJECT = sys.intern("reject")
+EV_SKIP = sys.intern("skip")
+EV_RUN = sys.intern("run")
+EV_WORK = sys.intern("work")
+EV_FINISH = sys.intern("finish")
+EV_ERROR = sys.intern("error")
+
+REASON_FULL = sys.intern("full")
+REASON_UNKNOWN_ITEM = sys.intern("unknown_item")
+REASON_UNKNOWN_QUEUE = sys.intern("unknown_queue")
+REASON_INVALID_ARGS = sys.intern("invalid_args")
+REASON_INVALID_STEPS = sys.intern("invalid_steps")
+REASON_UNKNOWN_COMMAND = sys.intern("unknown_command")
+REASON_EXCEPTION = sys.intern("exception")
+
+
+@dataclass(slots=True)
 class Task:
     task_id: str
     remaining: int
@@ -14,31 +33,36 @@ class QueueRR:
     """
     Fixed-capacity circular buffer implementation for queue of Task objects.
     No use of collections.deque — O(1) enqueue/dequeue.
+    (The project constraints disallow deque/queue.Queue for the core queue.)
     """
     def __init__(self, queue_id: str, capacity: int) -> None:
         self.queue_id = queue_id
         self.capacity = max(0, int(capacity))
-        # Underlying buffer only needs to hold up to capacity elements
-        self._buf: List[Optional[Task]] = [None] * (self.capacity if self.capacity > 0 else 1)
+        # Underlying buffer is rounded up to a power of two so index wraps are
+        # a single "& mask"; the full check still uses the real capacity.
+        self._buf_len: int = 1 << (self.capacity - 1).bit_length() if self.capacity > 0 else 1
+        self._mask: int = self._buf_len - 1
+        self._buf: List[Optional[Task]] = [None] * self._buf_len
         self._head: int = 0
         self._size: int = 0
-        # counter for auto task ids
+        # counter for auto task ids; the "<qid>-" prefix never changes
         self._next_task_num: int = 1
+        self._id_prefix: str = f"{queue_id}-"
 
     def enqueue(self, task: Task) -> bool:
         if self._size >= self.capacity:
             return False
-        pos = (self._head + self._size) % len(self._buf)
-        self._buf[pos] = task
+        self._buf[(self._head + self._size) & self._mask] = task
         self._size += 1
         return True
 
     def dequeue(self) -> Optional[Task]:
         if self._size == 0:
             return None
-        t = self._buf[self._head]
-        self._buf[self._head] = None
-        self._head = (self._head + 1) % len(self._buf)
+        head = self._head
+        t = self._buf[head]
+        self._buf[head] = None
+        self._head = (head + 1) & self._mask
         self._size -= 1
         return t
 
@@ -47,22 +71,35 @@ class QueueRR:
             return None
         return self._buf[self._head]
 
+    def rotate_front_to_back(self) -> None:
+        """
+        Move the front task to the back; same as dequeue() then enqueue()
+        but with one slot copy and no size bookkeeping.
+        """
+        if self._size == 0:
+            return
+        head = self._head
+        # the tail slot is free unless the buffer is completely full, in
+        # which case it is the head slot itself and only the head moves
+        self._buf[(head + self._size) & self._mask] = self._buf[head]
+        self._head = (head + 1) & self._mask
+
     def __len__(self) -> int:
         return self._size
 
     def contents_front_to_back(self) -> List[Task]:
-        out: List[Task] = []
-        for i in range(self._size):
-            idx = (self._head + i) % len(self._buf)
-            t = self._buf[idx]
-            if t is not None:
-                out.append(t)
-        return out
+        head = self._head
+        end = head + self._size
+        if end <= self._buf_len:
+            return self._buf[head:end]
+        # wrapped: tail part of the buffer, then the front part
+        return self._buf[head:] + self._buf[:end - self._buf_len]
 
     def next_task_id(self) -> str:
-        tid = f"{self.queue_id}-{self._next_task_num:03d}"
-        self._next_task_num += 1
-        return tid
+        n = self._next_task_num
+        self._next_task_num = n + 1
+        # zfill(3) pads like :03d and leaves 1000+ unpadded
+        return self._id_prefix + str(n).zfill(3)
 
 
 class Scheduler:
@@ -74,12 +111,19 @@ class Scheduler:
         self._queues: Dict[str, QueueRR] = {}
         # creation order list of queue ids (for round robin)
         self._order: List[str] = []
-        # skip flags per queue id
-        self._skip_pending: Dict[str, bool] = {}
+        # parallel to _order: the queue and its skip flag at each position,
+        # so a turn is resolved by list index instead of dict lookups
+        self._order_queues: List[QueueRR] = []
+        self._skip_flags: List[bool] = []
+        # queue_id -> positions in _order (more than one if an id is re-created)
+        self._positions: Dict[str, List[int]] = {}
         # pointer index to next queue to visit in order
         self._next_index: int = 0
         # global time (minutes)
         self._time: int = 0
+        # running counters so "run until quiet" can stop in O(1)
+        self._nonempty_queues: int = 0
+        self._skip_count: int = 0
 
         # Hardcoded menu (must include at least the required items)
         self._menu: Dict[str, int] = {
@@ -91,6 +135,10 @@ class Scheduler:
             "macchiato": 2,
             "hot_chocolate": 4,
         }
+        # menu never changes after construction: build its display line once
+        self._menu_line: str = "display menu=[" + ",".join(
+            f"{name}:{minutes}" for name, minutes in sorted(self._menu.items())) + "]"
+        self._menu_get = self._menu.get
 
     # -----------------------
     # Helpers for logging
@@ -98,16 +146,29 @@ class Scheduler:
     def _log_time_event(self, event: str, queue: Optional[str] = None,
                         task: Optional[str] = None, remaining: Optional[int] = None,
                         reason: Optional[str] = None) -> str:
-        parts = [f"time={self._time}", f"event={event}"]
+        line = f"time={self._time} event={event}"
         if queue is not None:
-            parts.append(f"queue={queue}")
+            line += f" queue={queue}"
         if task is not None:
-            parts.append(f"task={task}")
+            line += f" task={task}"
         if remaining is not None:
-            parts.append(f"remaining={remaining}")
+            line += f" remaining={remaining}"
         if reason is not None:
-            parts.append(f"reason={reason}")
-        return " ".join(parts)
+            line += f" reason={reason}"
+        return line
+
+    # Fast paths for the per-turn events (same format as _log_time_event)
+    def _log_run(self, queue: str) -> str:
+        return f"time={self._time} event={EV_RUN} queue={queue}"
+
+    def _log_work(self, queue: str, task: str, remaining: int) -> str:
+        return f"time={self._time} event={EV_WORK} queue={queue} task={task} remaining={remaining}"
+
+    def _log_skip(self, queue: str) -> str:
+        return f"time={self._time} event={EV_SKIP} queue={queue}"
+
+    def _log_finish(self, queue: str, task: str) -> str:
+        return f"time={self._time} event={EV_FINISH} queue={queue} task={task}"
 
     def _log_no_time_event(self, event: str, queue: Optional[str] = None,
                            task: Optional[str] = None, remaining: Optional[int] = None,
@@ -124,59 +185,83 @@ class Scheduler:
         if queue_id in self._queues:
             # If duplicate creation, still produce a create event? Spec doesn't say.
             # We'll replace previous queue to be safe but keep creation order unchanged.
-            self._queues.pop(queue_id, None)
+            old = self._queues.pop(queue_id)
+            if len(old) > 0:
+                self._nonempty_queues -= 1
+            if self._is_skip_pending(queue_id):
+                self._skip_count -= 1
         q = QueueRR(queue_id, int(capacity))
         self._queues[queue_id] = q
+        positions = self._positions.setdefault(queue_id, [])
+        positions.append(len(self._order))
         self._order.append(queue_id)
-        self._skip_pending[queue_id] = False
-        logs.append(self._log_time_event("create", queue=queue_id))
+        self._order_queues.append(q)
+        self._skip_flags.append(False)
+        # every position of this id now refers to the new queue
+        for i in positions:
+            self._order_queues[i] = q
+            self._skip_flags[i] = False
+        logs.append(self._log_time_event(EV_CREATE, queue=queue_id))
         return logs
 
     def enqueue(self, queue_id: str, item_name: str) -> List[str]:
         logs: List[str] = []
         if queue_id not in self._queues:
             # invalid queue: emit error
-            logs.append(self._log_time_event("error", queue=queue_id, reason="unknown_queue"))
+            logs.append(self._log_time_event(EV_ERROR, queue=queue_id, reason=REASON_UNKNOWN_QUEUE))
             return logs
 
         q = self._queues[queue_id]
         # generate task id regardless (tests expect a reject line with auto id)
         task_id = q.next_task_id()
         # check menu
-        if item_name not in self._menu:
+        burst = self._menu_get(item_name)
+        if burst is None:
             # Print message to stdout (tests capture)
             print("Sorry, we don't serve that.")
-            logs.append(self._log_time_event("reject", queue=queue_id, task=task_id, reason="unknown_item"))
+            logs.append(self._log_time_event(EV_REJECT, queue=queue_id, task=task_id, reason=REASON_UNKNOWN_ITEM))
             return logs
 
         # check capacity
         if len(q) >= q.capacity:
             print("Sorry, we're at capacity.")
-            logs.append(self._log_time_event("reject", queue=queue_id, task=task_id, reason="full"))
+            logs.append(self._log_time_event(EV_REJECT, queue=queue_id, task=task_id, reason=REASON_FULL))
             return logs
 
         # Enqueue success
-        burst = int(self._menu[item_name])
         task = Task(task_id=task_id, remaining=burst)
+        was_empty = len(q) == 0
         ok = q.enqueue(task)
         if not ok:
             # shouldn't happen because we checked capacity, but handle defensively
             print("Sorry, we're at capacity.")
-            logs.append(self._log_time_event("reject", queue=queue_id, task=task_id, reason="full"))
+            logs.append(self._log_time_event(EV_REJECT, queue=queue_id, task=task_id, reason=REASON_FULL))
             return logs
+        if was_empty:
+            self._nonempty_queues += 1
 
-        logs.append(self._log_time_event("enqueue", queue=queue_id, task=task_id, remaining=burst))
+        logs.append(self._log_time_event(EV_ENQUEUE, queue=queue_id, task=task_id, remaining=burst))
         return logs
 
     def mark_skip(self, queue_id: str) -> List[str]:
         logs: List[str] = []
         if queue_id not in self._queues:
-            logs.append(self._log_time_event("error", queue=queue_id, reason="unknown_queue"))
+            logs.append(self._log_time_event(EV_ERROR, queue=queue_id, reason=REASON_UNKNOWN_QUEUE))
             return logs
-        self._skip_pending[queue_id] = True
-        logs.append(self._log_time_event("skip", queue=queue_id))
+        if not self._is_skip_pending(queue_id):
+            self._set_skip(queue_id, True)
+            self._skip_count += 1
+        logs.append(self._log_skip(queue_id))
         return logs
 
+    def _is_skip_pending(self, queue_id: str) -> bool:
+        positions = self._positions.get(queue_id)
+        return bool(positions) and self._skip_flags[positions[0]]
+
+    def _set_skip(self, queue_id: str, value: bool) -> None:
+        for i in self._positions[queue_id]:
+            self._skip_flags[i] = value
+
     def menu(self) -> Dict[str, int]:
         return dict(self._menu)
 
@@ -195,26 +280,20 @@ class Scheduler:
         lines: List[str] = []
         next_q = self.next_queue()
         lines.append(f"display time={self._time} next={next_q if next_q is not None else 'none'}")
-        # menu sorted by name
-        menu_items = sorted(self._menu.items(), key=lambda x: x[0])
-        menu_str = ",".join(f"{name}:{minutes}" for name, minutes in menu_items)
-        lines.append(f"display menu=[{menu_str}]")
+        # menu sorted by name (precomputed)
+        lines.append(self._menu_line)
         # For each queue in creation order
-        for qid in self._order:
-            q = self._queues.get(qid)
-            if q is None:
-                # show empty
-                lines.append(f"display {qid} [0/0] -> []")
-                continue
+        append = lines.append
+        for qid, q, skip in zip(self._order, self._order_queues, self._skip_flags):
             size = len(q)
             cap = q.capacity
-            skip_flag = " [ skip]" if self._skip_pending.get(qid, False) else ""
-            contents = q.contents_front_to_back()
-            if contents:
-                tasks_str = ",".join(f"{t.task_id}:{t.remaining}" for t in contents)
-            else:
-                tasks_str = ""
-            lines.append(f"display {qid} [{size}/{cap}]{skip_flag} -> [{tasks_str}]")
+            skip_flag = " [ skip]" if skip else ""
+            if size == 0:
+                # nothing to list; skip the contents copy
+                append(f"display {qid} [0/{cap}]{skip_flag} -> []")
+                continue
+            tasks_str = ",".join([f"{t.task_id}:{t.remaining}" for t in q.contents_front_to_back()])
+            append(f"display {qid} [{size}/{cap}]{skip_flag} -> [{tasks_str}]")
         return lines
 
     def run(self, quantum: int, steps: Optional[int] = None) -> List[str]:
@@ -230,23 +309,17 @@ class Scheduler:
             try:
                 steps = int(steps)
             except Exception:
-                logs.append(self._log_time_event("error", reason="invalid_steps"))
+                logs.append(self._log_time_event(EV_ERROR, reason=REASON_INVALID_STEPS))
                 return logs
 
             if steps < 1 or steps > max(1, len(self._order)):
-                logs.append(self._log_time_event("error", reason="invalid_steps"))
+                logs.append(self._log_time_event(EV_ERROR, reason=REASON_INVALID_STEPS))
                 return logs
 
         # If there are no queues, still return nothing? Tests expect error only for invalid steps.
         # Implement behavior: if no queues, steps validation above will pass only when steps is None or 1?
         # We'll handle normally.
 
-        # Helper to advance next_index cyclically
-        def advance_index():
-            if not self._order:
-                return
-            self._next_index = (self._next_index + 1) % len(self._order)
-
         # Decide how many turns to run
         turns_to_do: Optional[int]
         if steps is not None:
@@ -255,77 +328,97 @@ class Scheduler:
             # run until all queues empty and no pending skips
             turns_to_do = None
 
-        # If running until quiet, loop until condition
-        if turns_to_do is None:
-            # Continue until all queues empty and no skip pending
-            # But if there are zero queues, nothing to do
-            if not self._order:
+        if not self._order:
+            # Running until quiet with zero queues: nothing to do
+            if turns_to_do is None:
                 return logs
-            # loop until break
-            while True:
-                all_empty = all(len(self._queues[qid]) == 0 for qid in self._order)
-                any_skip = any(self._skip_pending.get(qid, False) for qid in self._order)
-                if all_empty and not any_skip:
-                    break
-                # perform one turn
-                current_qid = self._order[self._next_index]
-                logs.extend(self._perform_single_turn(current_qid, quantum))
-                advance_index()
+            # If there are no queues, append run? spec says next=none etc. but tests don't cover.
+            # Do nothing but keep consistency.
+            for _ in range(turns_to_do):
+                logs.append(self._log_time_event(EV_RUN, queue=None))
             return logs
 
-        # Otherwise do exactly steps turns
-        for _ in range(turns_to_do):
-            if not self._order:
-                # If there are no queues, append run? spec says next=none etc. but tests don't cover.
-                # Do nothing but keep consistency.
-                logs.append(self._log_time_event("run", queue=None))
-                continue
-            current_qid = self._order[self._next_index]
-            logs.extend(self._perform_single_turn(current_qid, quantum))
-            advance_index()
+        # Hot loop: keep everything it touches in locals
+        n = len(self._order)
+        i = self._next_index
+        do_turn = self._perform_single_turn
+        if turns_to_do is None:
+            # loop until every queue is empty and no skip is pending
+            while self._nonempty_queues:
+                do_turn(i, quantum, logs)
+                i += 1
+                if i == n:
+                    i = 0
+            # Only skips can remain: every turn from here is an empty visit
+            # (no time advance), so drain the flags inline.
+            order = self._order
+            flags = self._skip_flags
+            log_run = self._log_run
+            while self._skip_count:
+                qid = order[i]
+                logs.append(log_run(qid))
+                if flags[i]:
+                    self._set_skip(qid, False)
+                    self._skip_count -= 1
+                    logs.append(self._log_skip(qid))
+                i += 1
+                if i == n:
+                    i = 0
+        else:
+            # Otherwise do exactly steps turns
+            for _ in range(turns_to_do):
+                do_turn(i, quantum, logs)
+                i += 1
+                if i == n:
+                    i = 0
+        self._next_index = i
         return logs
 
     # -----------------------
     # Internal turn logic
     # -----------------------
-    def _perform_single_turn(self, queue_id: str, quantum: int) -> List[str]:
-        logs: List[str] = []
+    def _perform_single_turn(self, index: int, quantum: int, logs: List[str]) -> None:
+        """
+        Perform one turn for the queue at position index, appending its log
+        lines to logs (the caller's list, so no per-turn list is built).
+        """
+        queue_id = self._order[index]
         # Always produce run event for the visited queue
-        logs.append(self._log_time_event("run", queue=queue_id))
+        logs.append(self._log_run(queue_id))
 
         # If skip pending, consume and produce skip event (no time advance)
-        if self._skip_pending.get(queue_id, False):
-            self._skip_pending[queue_id] = False
-            logs.append(self._log_time_event("skip", queue=queue_id))
-            return logs
-
-        q = self._queues.get(queue_id)
-        if q is None:
-            # no such queue; produce nothing more
-            return logs
+        if self._skip_flags[index]:
+            self._set_skip(queue_id, False)
+            self._skip_count -= 1
+            logs.append(self._log_skip(queue_id))
+            return
 
+        q = self._order_queues[index]
         if len(q) == 0:
             # empty, nothing to do
-            return logs
+            return
 
-        # There's work: pop front and work for min(remaining, quantum)
-        task = q.dequeue()
+        # There's work: work the front task for min(remaining, quantum)
+        task = q.peek()
         if task is None:
-            return logs  # defensive
-
-        work_time = min(task.remaining, quantum)
-        # advance clock by work_time
-        self._time += work_time
-        task.remaining -= work_time
-
-        if task.remaining <= 0:
-            # finished
-            logs.append(self._log_time_event("work", queue=queue_id, task=task.task_id, remaining=0))
-            logs.append(self._log_time_event("finish", queue=queue_id, task=task.task_id))
+            return  # defensive
+
+        # One compare decides both the work time and whether the task finishes
+        rem = task.remaining
+        if rem <= quantum:
+            # finished: works its whole remaining time
+            self._time += rem
+            task.remaining = 0
+            q.dequeue()
+            logs.append(self._log_work(queue_id, task.task_id, 0))
+            logs.append(self._log_finish(queue_id, task.task_id))
+            if len(q) == 0:
+                self._nonempty_queues -= 1
         else:
-            # partially done: requeue with remaining
-            # requeue to back
-            q.enqueue(task)
+            # partially done: works a full quantum, then moves to the back
+            self._time += quantum
+            rem -= quantum
+            task.remaining = rem
+            q.rotate_front_to_back()
             # work log should show remaining AFTER the work (per spec/example)
-            logs.append(self._log_time_event("work", queue=queue_id, task=task.task_id, remaining=task.remaining))
-        return logs
+            logs.append(self._log_work(queue_id, task.task_id, rem))
@@ -1,12 +1,15 @@
 # src/cli.py
 import sys
 from typing import List
-from scheduler import Scheduler
+from scheduler import (Scheduler, EV_ERROR, REASON_EXCEPTION, REASON_INVALID_ARGS,
+                       REASON_UNKNOWN_COMMAND)
 from parser import parse_command
 
 def _print_logs(logs: List[str]) -> None:
-    for l in logs:
-        print(l)
+    # one write per command instead of one print() per line
+    if logs:
+        sys.stdout.write("\n".join(logs))
+        sys.stdout.write("\n")
 
 def main_loop() -> None:
     sched = Scheduler()
@@ -37,7 +40,7 @@ def main_loop() -> None:
             try:
                 if cmd == "CREATE":
                     if len(args) != 2:
-                        print(sched._log_time_event("error", reason="invalid_args"))
+                        print(sched._log_time_event(EV_ERROR, reason=REASON_INVALID_ARGS))
                         continue
                     qid = args[0]
                     cap = int(args[1])
@@ -46,7 +49,7 @@ def main_loop() -> None:
 
                 elif cmd == "ENQ":
                     if len(args) != 2:
-                        print(sched._log_time_event("error", reason="invalid_args"))
+                        print(sched._log_time_event(EV_ERROR, reason=REASON_INVALID_ARGS))
                         continue
                     qid = args[0]
                     item = args[1]
@@ -55,7 +58,7 @@ def main_loop() -> None:
 
                 elif cmd == "SKIP":
                     if len(args) != 1:
-                        print(sched._log_time_event("error", reason="invalid_args"))
+                        print(sched._log_time_event(EV_ERROR, reason=REASON_INVALID_ARGS))
                         continue
                     qid = args[0]
                     logs = sched.mark_skip(qid)
@@ -63,15 +66,13 @@ def main_loop() -> None:
 
                 elif cmd == "RUN":
                     if len(args) == 0:
-                        print(sched._log_time_event("error", reason="invalid_args"))
+                        print(sched._log_time_event(EV_ERROR, reason=REASON_INVALID_ARGS))
                         continue
                     quantum = int(args[0])
                     steps = None
                     if len(args) >= 2:
                         steps = int(args[1])
                     logs = sched.run(quantum, steps)
-                    # Print logs
-                    _print_logs(logs)
                     # After each turn display is printed — the Scheduler.run returned aggregated logs
                     # but spec expects display after each turn. To keep things simple and deterministic,
                     # print display after entire run but tests in public check the logs rather than CLI display.
@@ -79,16 +80,15 @@ def main_loop() -> None:
                     # corresponding to the current state after the run.
                     # For better compliance, we will print the display block now.
                     # (Note: if tests call Scheduler.run directly, they don't rely on CLI.)
-                    display_lines = sched.display()
-                    for dl in display_lines:
-                        print(dl)
+                    # Print logs and display block together
+                    _print_logs(logs + sched.display())
 
                 else:
                     # Unknown command
-                    print(sched._log_time_event("error", reason="unknown_command"))
+                    print(sched._log_time_event(EV_ERROR, reason=REASON_UNKNOWN_COMMAND))
             except Exception as exc:
                 # avoid crashing the CLI; print a generic error log
-                print(sched._log_time_event("error", reason="exception"))
+                print(sched._log_time_event(EV_ERROR, reason=REASON_EXCEPTION))
     except KeyboardInterrupt:
         print("\nBreak time!")
         return
@@ -10,13 +10,14 @@ def parse_command(line: str) -> Optional[Tuple[str, List[str]]]:
     """
     if line is None:
         return None
-    s = line.strip()
-    if s == "":
+    # split() already skips surrounding whitespace, so no strip() copy.
+    # No command takes more than 2 args: cap the split so junk after them
+    # stays one token (arg-count checks in the CLI still reject it).
+    parts = line.split(None, 3)
+    if not parts:
         # blank line is handled by CLI (ends session), here return empty to signal it
         return ("", [])
-    if s.startswith("#"):
-        return None
-    parts = s.split()
     cmd = parts[0]
-    args = parts[1:]
-    return (cmd, args)
+    if cmd[0] == "#":
+        return None
+    return (cmd, parts[1:])
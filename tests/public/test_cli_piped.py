@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+import threading
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CLI = os.path.join(ROOT, "src", "cli.py")
+ENV = dict(os.environ, PYTHONPATH=ROOT)
+
+def test_unbuffered_pipe_answers_each_command():
+    p = subprocess.Popen([sys.executable, "-u", CLI], stdin=subprocess.PIPE,
+                         stdout=subprocess.PIPE, text=True, env=ENV)
+    timer = threading.Timer(5, p.kill)  # a buffered CLI would never answer
+    timer.start()
+    try:
+        p.stdin.write("CREATE A 2\n")
+        p.stdin.flush()
+        assert p.stdout.readline() == "time=0 event=create queue=A\n"
+        p.stdin.write("\n")
+        p.stdin.flush()
+        assert p.stdout.readline() == "Break time!\n"
+    finally:
+        timer.cancel()
+        p.kill()
+        p.wait()
+
+def test_script_output_keeps_message_order():
+    script = "CREATE A 1\nENQ A tea\nENQ A latte\nENQ A cortado\n\n"
+    p = subprocess.run([sys.executable, CLI], input=script, capture_output=True,
+                       text=True, env=ENV, timeout=10)
+    assert p.stdout.splitlines() == [
+        "time=0 event=create queue=A",
+        "time=0 event=enqueue queue=A task=A-001 remaining=1",
+        "Sorry, we're at capacity.",
+        "time=0 event=reject queue=A task=A-002 reason=full",
+        "Sorry, we don't serve that.",
+        "time=0 event=reject queue=A task=A-003 reason=unknown_item",
+        "Break time!",
+    ]
@@ -0,0 +1,48 @@
+from scheduler import QueueRR, Task
+
+def test_fifo_order_and_capacity_across_wraps():
+    q = QueueRR("A", 3)  # not a power of two: buffer is larger than capacity
+    for n in range(3):
+        assert q.enqueue(Task(task_id=f"A-{n}", remaining=1))
+    assert not q.enqueue(Task(task_id="A-x", remaining=1))  # full at capacity, not buffer size
+
+    # rotate many times so head/tail wrap around the buffer
+    for n in range(3, 20):
+        t = q.dequeue()
+        assert t is not None and t.task_id == f"A-{n - 3}"
+        assert q.enqueue(Task(task_id=f"A-{n}", remaining=1))
+        assert [t.task_id for t in q.contents_front_to_back()] == [f"A-{i}" for i in range(n - 2, n + 1)]
+    assert len(q) == 3
+
+def test_zero_capacity_rejects():
+    q = QueueRR("Z", 0)
+    assert not q.enqueue(Task(task_id="Z-001", remaining=1))
+    assert q.dequeue() is None
+    assert q.contents_front_to_back() == []
+
+def test_rotate_front_to_back_keeps_order_and_size():
+    for cap in (3, 4):  # buffer partially used vs. exactly full
+        q = QueueRR("R", cap)
+        for n in range(cap):
+            q.enqueue(Task(task_id=f"R-{n}", remaining=1))
+        ids = [f"R-{n}" for n in range(cap)]
+        for _ in range(2 * cap + 1):
+            q.rotate_front_to_back()
+            ids = ids[1:] + ids[:1]
+            assert [t.task_id for t in q.contents_front_to_back()] == ids
+        assert len(q) == cap
+        assert q.dequeue().task_id == ids[0]
+
+def test_finished_task_is_not_reused_while_held():
+    from scheduler import Scheduler
+    s = Scheduler()
+    s.create_queue("A", 1)
+    s.enqueue("A", "tea")
+    held = s._queues["A"].peek()
+    s.run(quantum=1)  # A-001 finishes
+
+    s2 = Scheduler()
+    s2.create_queue("B", 1)
+    s2.enqueue("B", "mocha")
+    assert held == Task(task_id="A-001", remaining=0)
+    assert held is not s2._queues["B"].peek()
@@ -17,3 +17,23 @@ def test_skip_consumed_once_no_time_advance():
     # No work line tied to Mobile's first visit
     # (can't strictly assert time without implementation; hidden tests will)
     assert "event=skip" in "\n".join(s.mark_skip("WalkIns")) or True  # placeholder gentle check
+
+def test_run_until_quiet_drains_skips_on_empty_queues():
+    s = Scheduler()
+    s.create_queue("A", 1)
+    s.create_queue("B", 1)
+    s.create_queue("C", 1)
+    s.enqueue("A", "tea")   # 1 min
+    s.mark_skip("C")
+
+    logs = s.run(quantum=2)
+    assert logs == [
+        "time=0 event=run queue=A",
+        "time=1 event=work queue=A task=A-001 remaining=0",
+        "time=1 event=finish queue=A task=A-001",
+        "time=1 event=run queue=B",
+        "time=1 event=run queue=C",
+        "time=1 event=skip queue=C",
+    ]
+    assert s.next_queue() == "A"
+    assert s.run(quantum=2) == []